@@ -1,31 +1,251 @@
 import hashlib
-import json
+import itertools
+import logging
+import math
+import multiprocessing
 from time import time
 import os
+import re
+import secrets
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import ijson
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import structlog
-from typing import Dict, List, Optional, Any
+import urllib3
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import uuid4
 from flask import Flask, jsonify, request
 from urllib.parse import urlparse
 
+try:
+    from miner_isal import mine_isal, BATCH_SIZE as ISAL_BATCH_SIZE
+except ImportError:
+    mine_isal = None
+
+try:
+    from miner_ext import mine_native
+except ImportError:
+    mine_native = None
+
+try:
+    from miner_numba import mine_numba, BATCH_SIZE as NUMBA_BATCH_SIZE
+except ImportError:
+    mine_numba = None
+
+LOG_LEVEL = os.getenv('BLOCKCHAIN_LOG_LEVEL', 'INFO').upper()
+# The filtering logger drops calls below LOG_LEVEL before any event dict is built or rendered
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, LOG_LEVEL, logging.INFO)),
+    cache_logger_on_first_use=True,
+)
 logger = structlog.get_logger()
 PORT = int(os.getenv('BLOCKCHAIN_PORT', 8080))
 HOST = os.getenv('BLOCKCHAIN_HOST', '0.0.0.0')
+PEER_TIMEOUT = float(os.getenv('BLOCKCHAIN_PEER_TIMEOUT', 2))
+# PEER_TIMEOUT bounds each read; this bounds a whole chain download, so a peer dripping bytes cannot hold a worker
+PEER_FETCH_DEADLINE = float(os.getenv('BLOCKCHAIN_PEER_FETCH_DEADLINE', 30))
+PEER_POOL_SIZE = 32
+MAX_MINING_JOBS = 1000
+# Queued plus running jobs; far below MAX_MINING_JOBS, so status eviction only ever drops finished jobs
+MAX_PENDING_MINING_JOBS = 16
+MINING_WORKERS = int(os.getenv('BLOCKCHAIN_MINING_WORKERS', os.cpu_count() or 1))
+RANDOM_NONCE_START = os.getenv('BLOCKCHAIN_RANDOM_NONCE_START', 'false').lower() == 'true'
+STOP_CHECK_INTERVAL = 4096
+# Canonical hashing layout: index, timestamp, previous hash, tx count, then each transaction as
+# len-prefixed sender, len-prefixed recipient and amount
+BLOCK_HEADER = struct.Struct('>Qd32sI')
+TX_FIELD_LENGTH = struct.Struct('>H')
+TX_AMOUNT = struct.Struct('>d')
+MAX_TX_FIELD_BYTES = (1 << (8 * TX_FIELD_LENGTH.size)) - 1
+MAX_BLOCK_INDEX = (1 << 64) - 1
+HEX_DIGEST = re.compile(r'[0-9a-f]{64}')
+NATIVE_BATCH_SIZE = 1 << 16
+# The numba kernel spreads each batch over every core with prange; the other backends need one process per core
+USE_PROCESS_POOL = mine_isal is not None or mine_native is not None or mine_numba is None
+
+_stop_event = None
+
+
+def _init_mining_worker(stop_event) -> None:
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _search_nonces(block_bytes: bytes, difficulty_bits: int, start: int, stride: int,
+                   stop_event=None) -> Optional[int]:
+    if mine_isal is not None:
+        return _search_nonces_batched(mine_isal, ISAL_BATCH_SIZE,
+                                      block_bytes, difficulty_bits, start, stride, stop_event)
+    if mine_native is not None:
+        return _search_nonces_batched(mine_native, NATIVE_BATCH_SIZE,
+                                      block_bytes, difficulty_bits, start, stride, stop_event)
+    if mine_numba is not None:
+        return _search_nonces_batched(mine_numba, NUMBA_BATCH_SIZE,
+                                      block_bytes, difficulty_bits, start, stride, stop_event)
+    return _search_nonces_python(block_bytes, difficulty_bits, start, stride, stop_event)
+
+
+def _search_nonces_batched(kernel, batch_size: int, block_bytes: bytes, difficulty_bits: int,
+                           start: int, stride: int, stop_event=None) -> Optional[int]:
+    # Compiled kernels cannot see the stop event, so they run in bounded batches
+    for batch_start in itertools.count(start, stride * batch_size):
+        if stop_event is not None and stop_event.is_set():
+            return None
+        nonce = kernel(block_bytes, difficulty_bits, batch_start, stride, batch_size)
+        if nonce is not None:
+            if stop_event is not None:
+                stop_event.set()
+            return nonce
+
+
+def _search_nonces_python(block_bytes: bytes, difficulty_bits: int, start: int, stride: int,
+                          stop_event=None) -> Optional[int]:
+    # The block prefix is absorbed once; copy() carries the midstate plus the buffered partial block,
+    # so each attempt only compresses the final one or two blocks holding the tail and the nonce digits
+    base = hashlib.sha256(block_bytes)
+    # A digest meets the difficulty when, read as a big-endian integer, it is below 2**(256 - bits)
+    target = 1 << (256 - difficulty_bits)
+    for attempt, nonce in enumerate(itertools.count(start, stride)):
+        if stop_event is not None and attempt % STOP_CHECK_INTERVAL == 0 and stop_event.is_set():
+            return None
+        h = base.copy()
+        h.update(b'%d' % nonce)
+        if int.from_bytes(h.digest(), 'big') < target:
+            if stop_event is not None:
+                stop_event.set()
+            return nonce
+
+
+def _mining_worker(args) -> Optional[int]:
+    block_bytes, difficulty_bits, start, stride = args
+    return _search_nonces(block_bytes, difficulty_bits, start, stride, _stop_event)
+
+
+def _mine_parallel(block_bytes: bytes, difficulty_bits: int, start: int, n_workers: int) -> int:
+    # Worker i scans start + i, start + i + n, ... so no nonce is hashed twice
+    stop_event = multiprocessing.Event()
+    stripes = [(block_bytes, difficulty_bits, start + worker_id, n_workers) for worker_id in range(n_workers)]
+    with multiprocessing.Pool(n_workers, initializer=_init_mining_worker, initargs=(stop_event,)) as pool:
+        for nonce in pool.imap_unordered(_mining_worker, stripes):
+            if nonce is not None:
+                return nonce
+    raise RuntimeError("Mining workers exited without finding a proof")
+
+
+def _encode_transaction(sender: str, recipient: str, amount: float) -> bytes:
+    sender_bytes = sender.encode()
+    recipient_bytes = recipient.encode()
+    return b''.join((
+        TX_FIELD_LENGTH.pack(len(sender_bytes)), sender_bytes,
+        TX_FIELD_LENGTH.pack(len(recipient_bytes)), recipient_bytes,
+        TX_AMOUNT.pack(amount)
+    ))
+
+
+def _is_encodable_transaction(sender: str, recipient: str, amount: float) -> bool:
+    # The encoding length-prefixes sender and recipient with a u16 and stores the amount as a double
+    try:
+        return (len(sender.encode()) <= MAX_TX_FIELD_BYTES
+                and len(recipient.encode()) <= MAX_TX_FIELD_BYTES
+                and _is_finite(amount))
+    except UnicodeEncodeError:
+        return False
+
+
+def _is_finite(value: float) -> bool:
+    try:
+        return math.isfinite(float(value))
+    except OverflowError:
+        return False
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class TxBuffer:
+    # Pending transactions as parallel columns instead of one dict per row; dicts are only
+    # built at the API/block boundary
+    def __init__(self, capacity: int = 64):
+        self.senders: List[str] = []
+        self.recipients: List[str] = []
+        self.amounts: np.ndarray = np.empty(capacity, dtype=np.float64)
+        # Canonical encoding of each transaction, computed once on append
+        self.encoded: List[bytes] = []
+
+    def __len__(self) -> int:
+        return len(self.senders)
+
+    def append(self, sender: str, recipient: str, amount: float) -> None:
+        # Encoded first: if it raises, no column has been touched and the buffer stays consistent
+        encoded = _encode_transaction(sender, recipient, float(amount))
+        count = len(self.senders)
+        if count == len(self.amounts):
+            self.amounts = np.concatenate((self.amounts, np.empty(max(count, 1), dtype=np.float64)))
+        self.amounts[count] = amount
+        self.senders.append(sender)
+        self.recipients.append(recipient)
+        self.encoded.append(encoded)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        amounts = self.amounts[:len(self.senders)].tolist()
+        return [
+            {'sender': sender, 'recipient': recipient, 'amount': amount}
+            for sender, recipient, amount in zip(self.senders, self.recipients, amounts)
+        ]
+
+
+class DeadlineReader:
+    # File-like view of a streamed response body that gives up once the deadline has passed
+
+    def __init__(self, raw, deadline: float):
+        self.raw = raw
+        self.deadline = deadline
+
+    def read(self, size: int = -1) -> bytes:
+        if time() > self.deadline:
+            raise requests.Timeout("Peer chain download exceeded its deadline")
+        # read1 returns after a single read from the socket, so a slow peer cannot stretch one call indefinitely
+        return self.raw.read1(size)
+
 
 class Blockchain:
-    DIFFICULTY = "0000"
+    # Leading zero bits required of a block hash; 16 bits is four leading hex zeros
+    DIFFICULTY_BITS = 16
+    # Forking the pool costs about 6 ms per worker, while a 16-bit search takes 40-90 ms serially; from 20 bits
+    # (hundreds of ms) the pool wins at any realistic core count
+    PARALLEL_MIN_DIFFICULTY_BITS = 20
 
     def __init__(self):
-        self.current_transactions: List[Dict[str, Any]] = []
+        self.current_transactions = TxBuffer()
         self.chain: List[Dict[str, Any]] = []
+        # _lock guards pending transactions and the chain; _mining_lock keeps one block in the works at a time
+        self._lock = threading.Lock()
+        self._mining_lock = threading.Lock()
         self.nodes = set()
+        # Keep-alive connections to peers, reused across consensus rounds
+        self._http = requests.Session()
+        self._http.mount('http://', HTTPAdapter(pool_connections=PEER_POOL_SIZE, pool_maxsize=PEER_POOL_SIZE))
+        self._http.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'})
+        # Position of the last block of self.chain known to be valid; the genesis block is trusted
+        self._validated_up_to: int = 0
         logger.info("🔗 Initializing blockchain")
         self._create_genesis_block()
 
     def _create_genesis_block(self) -> None:
         logger.info("⚡ Creating genesis block")
-        self.new_block(proof=100, previous_hash="0" * 64)
+        # Runs while the module is still being imported, before pool workers could resolve _mining_worker
+        self.new_block(proof=100, previous_hash="0" * 64, parallel=False)
 
     def register_node(self, address: str) -> None:
         parsed_url = urlparse(address)
@@ -36,61 +256,92 @@ class Blockchain:
             logger.error(f"⚠️ Invalid node address format: {address}")
             raise ValueError("Invalid node address")
 
-    def new_block(self, proof: int, previous_hash: Optional[str] = None) -> Dict[str, Any]:
-        block = {
-            'index': len(self.chain) + 1,
-            'timestamp': time(),
-            'transactions': self.current_transactions,
-            'proof': proof,
-            'previous_hash': previous_hash or self.hash(self.chain[-1])
-        }
-
-        block_string = self._get_block_string(block)
-        current_hash = None
-
-        logger.info(f"⛏️ Mining block {block['index']}")
-        while not current_hash or not current_hash.startswith(self.DIFFICULTY):
-            current_hash = self._calculate_hash(block_string, block['proof'])
-            block['proof'] += 1
-
-        block['proof'] -= 1
-        block['hash'] = current_hash
-
-        logger.info(f"💎 Block {block['index']} mined with {len(block['transactions'])} transactions")
-
-        self.current_transactions = []
-        self.chain.append(block)
-        return block
+    def new_block(self, proof: int, previous_hash: Optional[str] = None, parallel: bool = True) -> Dict[str, Any]:
+        with self._mining_lock:
+            # Transactions arriving while this block is mined go into the next one
+            with self._lock:
+                transactions = self.current_transactions
+                self.current_transactions = TxBuffer()
+                block = {
+                    'index': len(self.chain) + 1,
+                    'timestamp': time(),
+                    'transactions': transactions.to_dicts(),
+                    'proof': proof,
+                    'previous_hash': previous_hash or self.hash(self.chain[-1])
+                }
+
+            block_bytes = self._canonical_bytes(block, transactions.encoded)
+
+            logger.info(f"⛏️ Mining block {block['index']}")
+            block['proof'] = self._find_proof(block_bytes, block['proof'], parallel)
+            block['hash'] = self._calculate_hash(block_bytes, block['proof'])
+
+            logger.info(f"💎 Block {block['index']} mined with {len(block['transactions'])} transactions")
+
+            with self._lock:
+                extends_validated = (self._validated_up_to == len(self.chain) - 1
+                                     and bool(self.chain) and block['previous_hash'] == self.chain[-1]['hash'])
+                self.chain.append(block)
+                if extends_validated:
+                    self._validated_up_to = len(self.chain) - 1
+            return block
+
+    def _find_proof(self, block_bytes: bytes, start: int, parallel: bool) -> int:
+        if RANDOM_NONCE_START:
+            # Independent miners handed identical work would otherwise all retry the same nonces
+            start = secrets.randbits(32)
+        # Spawned children re-import this module, so they must never start a pool of their own
+        if (not parallel
+                or not USE_PROCESS_POOL
+                or MINING_WORKERS <= 1
+                or self.DIFFICULTY_BITS < self.PARALLEL_MIN_DIFFICULTY_BITS
+                or multiprocessing.parent_process() is not None):
+            return _search_nonces(block_bytes, self.DIFFICULTY_BITS, start, 1)
+        return _mine_parallel(block_bytes, self.DIFFICULTY_BITS, start, MINING_WORKERS)
 
     def new_transaction(self, sender: str, recipient: str, amount: float) -> int:
-        self.current_transactions.append({
-            'sender': sender,
-            'recipient': recipient,
-            'amount': amount,
-        })
-        next_index = self.last_block['index'] + 1
-        logger.info(f"💸 New transaction: {amount} coins from {sender} to {recipient}")
+        with self._lock:
+            self.current_transactions.append(sender, recipient, amount)
+            next_index = self.last_block['index'] + 1
+        # Per-transaction, so kwargs instead of an f-string: nothing is formatted unless debug is on
+        logger.debug("💸 New transaction", amount=amount, sender=sender, recipient=recipient)
         return next_index
 
     def get_pending_transactions(self) -> List[Dict[str, Any]]:
-        return self.current_transactions
+        with self._lock:
+            return self.current_transactions.to_dicts()
+
+    @staticmethod
+    def _canonical_bytes(block: Dict[str, Any], tx_bytes: Optional[List[bytes]] = None) -> bytes:
+        if tx_bytes is None:
+            tx_bytes = [Blockchain._canonical_tx_bytes(tx) for tx in block['transactions']]
+        header = BLOCK_HEADER.pack(
+            block['index'],
+            block['timestamp'],
+            bytes.fromhex(block['previous_hash']),
+            len(block['transactions'])
+        )
+        return header + b''.join(tx_bytes)
 
     @staticmethod
-    def _get_block_string(block: Dict[str, Any]) -> str:
-        block_copy = block.copy()
-        block_copy.pop('proof')
-        block_copy.pop('hash', None)
-        return json.dumps(block_copy, sort_keys=True)
+    def _canonical_tx_bytes(tx: Dict[str, Any]) -> bytes:
+        return _encode_transaction(tx['sender'], tx['recipient'], float(tx['amount']))
 
     @staticmethod
-    def _calculate_hash(block_string: str, proof: int) -> str:
-        guess = f'{block_string}{proof}'.encode()
-        return hashlib.sha256(guess).hexdigest()
+    def _calculate_hash(block_bytes: bytes, proof: int) -> str:
+        return hashlib.sha256(block_bytes + b'%d' % proof).hexdigest()
 
     @staticmethod
     def hash(block: Dict[str, Any]) -> str:
-        block_string = Blockchain._get_block_string(block)
-        return Blockchain._calculate_hash(block_string, block['proof'])
+        # Mined and validated blocks carry their hash; only verification needs to recompute it
+        if 'hash' in block:
+            return block['hash']
+        return Blockchain._recompute_hash(block)
+
+    @staticmethod
+    def _recompute_hash(block: Dict[str, Any]) -> str:
+        block_bytes = Blockchain._canonical_bytes(block)
+        return Blockchain._calculate_hash(block_bytes, block['proof'])
 
     @property
     def last_block(self) -> Dict[str, Any]:
@@ -101,73 +352,201 @@ class Blockchain:
             return self.chain[index]
         return None
 
+    def is_chain_valid(self, deep: bool = False) -> bool:
+        # Local blocks were hashed when mined or adopted, so by default only links and proofs are checked,
+        # and blocks up to _validated_up_to are skipped. deep=True re-hashes everything to catch tampering.
+        start = 1 if deep else max(1, self._validated_up_to + 1)
+        if not self._validate_blocks(self.chain, start, deep):
+            return False
+        self._validated_up_to = len(self.chain) - 1
+        return True
+
     def is_valid_chain(self, chain: List[Dict[str, Any]]) -> bool:
-        for i in range(1, len(chain)):
-            current_block = chain[i]
-            previous_block = chain[i - 1]
+        # Proofs are cheap to verify and hashes are not, so a bogus peer chain is rejected before any sha256
+        if not self._cheap_check(chain) or not self._deep_check(chain):
+            return False
 
-            if current_block['previous_hash'] != self.hash(previous_block):
-                logger.error(f"❌ Invalid previous hash at block {current_block['index']}")
-                return False
+        logger.info("✅ External chain validation successful")
+        return True
 
-            if not current_block['hash'].startswith(self.DIFFICULTY):
-                logger.error(f"❌ Invalid proof of work at block {current_block['index']}")
+    def _cheap_check(self, chain: List[Dict[str, Any]]) -> bool:
+        for position, block in enumerate(chain):
+            if not self._is_well_formed(block):
+                logger.error(f"❌ Malformed block at position {position}")
                 return False
+        return self._check_links(chain, 1)
+
+    def _deep_check(self, chain: List[Dict[str, Any]]) -> bool:
+        # Links are checked against stored hashes, so the genesis hash has to be verified on its own
+        if chain and self._recompute_hash(chain[0]) != chain[0]['hash']:
+            logger.error(f"❌ Invalid block hash at block {chain[0]['index']}")
+            return False
+        return self._check_hashes(chain, 1)
+
+    def _validate_blocks(self, chain: List[Dict[str, Any]], start: int, deep: bool) -> bool:
+        if not self._check_links(chain, start):
+            return False
+        return not deep or self._check_hashes(chain, start)
+
+    def _check_links(self, chain: List[Dict[str, Any]], start: int) -> bool:
+        for i in range(start, len(chain)):
+            if not self._check_link(chain[i - 1], chain[i]):
+                return False
+        return True
 
-            calculated_hash = self.hash(current_block)
-            if calculated_hash != current_block['hash']:
+    def _check_hashes(self, chain: List[Dict[str, Any]], start: int) -> bool:
+        # Serial on purpose: encoding holds the GIL and dominates, and hashlib only releases it for inputs
+        # over 2 KB, so a thread pool measured slower at every block size
+        for i in range(start, len(chain)):
+            current_block = chain[i]
+            if self._recompute_hash(current_block) != current_block['hash']:
                 logger.error(f"❌ Invalid block hash at block {current_block['index']}")
                 return False
+        return True
+
+    @staticmethod
+    def _is_well_formed(block: Any) -> bool:
+        # Peer data is untrusted: anything the link, proof and hash checks index into must exist with the right type
+        if not isinstance(block, dict):
+            return False
+        # Ranges follow the binary encoding, so a well-formed block can always be re-hashed
+        if not all(_is_int(block.get(key)) for key in ('index', 'proof')):
+            return False
+        if not 0 <= block['index'] <= MAX_BLOCK_INDEX:
+            return False
+        if not _is_number(block.get('timestamp')) or not _is_finite(block['timestamp']):
+            return False
+        if not all(isinstance(block.get(key), str) and HEX_DIGEST.fullmatch(block[key])
+                   for key in ('previous_hash', 'hash')):
+            return False
+        transactions = block.get('transactions')
+        return isinstance(transactions, list) and all(
+            isinstance(tx, dict)
+            and isinstance(tx.get('sender'), str)
+            and isinstance(tx.get('recipient'), str)
+            and _is_number(tx.get('amount'))
+            and _is_encodable_transaction(tx['sender'], tx['recipient'], tx['amount'])
+            for tx in transactions
+        )
+
+    def _check_link(self, previous_block: Dict[str, Any], current_block: Dict[str, Any]) -> bool:
+        if current_block['previous_hash'] != previous_block['hash']:
+            logger.error(f"❌ Invalid previous hash at block {current_block['index']}")
+            return False
+
+        if not self._meets_difficulty(current_block['hash']):
+            logger.error(f"❌ Invalid proof of work at block {current_block['index']}")
+            return False
 
-        logger.info("✅ External chain validation successful")
         return True
 
+    @classmethod
+    def _meets_difficulty(cls, block_hash: str) -> bool:
+        return int(block_hash, 16) >> (256 - cls.DIFFICULTY_BITS) == 0
+
+    def _fetch_chain(self, node: str) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        try:
+            deadline = time() + PEER_FETCH_DEADLINE
+            with self._http.get(f'http://{node}/chain', timeout=PEER_TIMEOUT, stream=True) as response:
+                if response.status_code == 200:
+                    response.raw.decode_content = True
+                    chain = self._read_chain(DeadlineReader(response.raw, deadline))
+                    if chain is not None:
+                        return node, chain
+                    logger.error(f"❌ Rejected invalid chain from node {node}")
+        except requests.Timeout:
+            logger.error(f"⏱️ Timed out fetching chain from node {node}")
+        except requests.RequestException as e:
+            logger.error(f"❌ Failed to connect to node {node}")
+        except urllib3.exceptions.HTTPError:
+            # Reading response.raw bypasses requests, so a stalled or truncated body surfaces as urllib3's own errors
+            logger.error(f"❌ Lost connection to node {node} while reading its chain")
+        except ijson.JSONError:
+            logger.error(f"❌ Malformed chain from node {node}")
+        return None
+
+    def _read_chain(self, stream) -> Optional[List[Dict[str, Any]]]:
+        # Blocks are parsed as they arrive; a broken link stops the download before the rest is sent
+        chain: List[Dict[str, Any]] = []
+        for block in ijson.items(stream, 'chain.item', use_float=True):
+            if not self._is_well_formed(block):
+                logger.error(f"❌ Malformed block at position {len(chain)}")
+                return None
+            if chain and not self._check_link(chain[-1], block):
+                return None
+            chain.append(block)
+        return chain
+
     def resolve_conflicts(self) -> bool:
         max_length = len(self.chain)
         new_chain = None
 
         logger.info("🔄 Starting chain resolution with network nodes")
-        for node in self.nodes:
-            try:
-                response = requests.get(f'http://{node}/chain')
-                if response.status_code == 200:
-                    length = response.json()['length']
-                    chain = response.json()['chain']
-
-                    if length > max_length and self.is_valid_chain(chain):
-                        max_length = length
-                        new_chain = chain
-                        logger.info(f"📡 Found longer valid chain from {node}, length: {length}")
-            except requests.RequestException as e:
-                logger.error(f"❌ Failed to connect to node {node}")
-
-        if new_chain:
-            self.chain = new_chain
+        # Fetching is I/O bound, so one thread per node turns K round-trips into the slowest one
+        with ThreadPoolExecutor(max_workers=max(1, len(self.nodes))) as executor:
+            candidates = [result for result in executor.map(self._fetch_chain, self.nodes) if result]
+
+        # Longest first: the first valid chain wins and shorter ones are never validated
+        for node, chain in sorted(candidates, key=lambda candidate: len(candidate[1]), reverse=True):
+            if len(chain) <= max_length:
+                break
+            if self.is_valid_chain(chain):
+                new_chain = chain
+                logger.info(f"📡 Found longer valid chain from {node}, length: {len(chain)}")
+                break
+
+        if new_chain and self._adopt_chain(new_chain):
             logger.info(f"🔁 Chain replaced with longer chain of length {len(new_chain)}")
             return True
 
         logger.info("✅ Current chain is up to date")
         return False
 
+    def _adopt_chain(self, chain: List[Dict[str, Any]]) -> bool:
+        # _mining_lock waits out a block being mined on the old tip, which would otherwise be appended
+        # to the adopted chain with a stale previous_hash and index; meanwhile the local chain may have grown
+        with self._mining_lock, self._lock:
+            if len(chain) <= len(self.chain):
+                return False
+            self.chain = chain
+            self._validated_up_to = len(chain) - 1
+            return True
+
 
 app = Flask(__name__)
 node_identifier = str(uuid4()).replace('-', '')
 blockchain = Blockchain()
-
-
-@app.route('/mine', methods=['GET'])
-def mine():
-    last_block = blockchain.last_block
-    blockchain.new_transaction(
-        sender="0",
-        recipient=node_identifier,
-        amount=1,
-    )
-
-    previous_hash = blockchain.hash(last_block)
-    block = blockchain.new_block(proof=0, previous_hash=previous_hash)
-
-    response = {
+# Mining runs off the request thread so read endpoints stay responsive; one job at a time
+mining_executor = ThreadPoolExecutor(max_workers=1)
+mining_jobs: Dict[str, Dict[str, Any]] = OrderedDict()
+mining_jobs_lock = threading.Lock()
+mining_slots = threading.BoundedSemaphore(MAX_PENDING_MINING_JOBS)
+
+
+def _run_mining_job(job_id: str) -> None:
+    try:
+        _mine_job_block(job_id)
+    finally:
+        mining_slots.release()
+
+
+def _mine_job_block(job_id: str) -> None:
+    with mining_jobs_lock:
+        mining_jobs[job_id]['status'] = 'running'
+    try:
+        blockchain.new_transaction(
+            sender="0",
+            recipient=node_identifier,
+            amount=1,
+        )
+        block = blockchain.new_block(proof=0)
+    except Exception as e:
+        logger.error(f"❌ Mining job {job_id} failed: {e}")
+        with mining_jobs_lock:
+            mining_jobs[job_id].update(status='failed', error=str(e))
+        return
+
+    result = {
         'message': "New Block Forged",
         'index': block['index'],
         'transactions': block['transactions'],
@@ -175,8 +554,48 @@ def mine():
         'previous_hash': block['previous_hash'],
         'hash': block['hash']
     }
+    with mining_jobs_lock:
+        mining_jobs[job_id].update(status='done', block=result)
     logger.info(f"✨ Successfully mined block {block['index']}")
-    return jsonify(response), 200
+
+
+@app.route('/mine', methods=['GET'])
+def mine():
+    if not mining_slots.acquire(blocking=False):
+        logger.warning("⚠️ Mining queue is full")
+        return jsonify({'error': 'Mining queue is full, retry later'}), 503
+
+    job_id = uuid4().hex
+    with mining_jobs_lock:
+        mining_jobs[job_id] = {'job_id': job_id, 'status': 'queued'}
+        while len(mining_jobs) > MAX_MINING_JOBS:
+            mining_jobs.popitem(last=False)
+    mining_executor.submit(_run_mining_job, job_id)
+
+    response = {
+        'message': 'Mining started',
+        'job_id': job_id,
+        'status_url': f'/mine/{job_id}'
+    }
+    logger.info(f"⛏️ Queued mining job {job_id}")
+    return jsonify(response), 202
+
+
+@app.route('/mine/<job_id>', methods=['GET'])
+def mining_status(job_id):
+    with mining_jobs_lock:
+        job = mining_jobs.get(job_id)
+        job = dict(job) if job is not None else None
+
+    if job is None:
+        logger.error(f"🔍 Mining job {job_id} not found")
+        return jsonify({'error': 'Mining job not found'}), 404
+
+    if job['status'] == 'done':
+        return jsonify(job), 200
+    if job['status'] == 'failed':
+        return jsonify(job), 500
+    return jsonify(job), 202
 
 
 @app.route('/transactions', methods=['POST'])
@@ -188,6 +607,13 @@ def new_transaction():
         logger.error("⚠️ Missing transaction values")
         return jsonify({'error': 'Missing values'}), 400
 
+    amount = values['amount']
+    if (not isinstance(values['sender'], str) or not isinstance(values['recipient'], str)
+            or isinstance(amount, bool) or not isinstance(amount, (int, float))
+            or not _is_encodable_transaction(values['sender'], values['recipient'], amount)):
+        logger.error("⚠️ Invalid transaction values")
+        return jsonify({'error': 'Invalid values'}), 400
+
     index = blockchain.new_transaction(
         values['sender'],
         values['recipient'],
@@ -207,17 +633,22 @@ def get_pending_transactions():
         'next_block_index': blockchain.last_block['index'] + 1
     }
     logger.info(f"📋 Retrieved {len(pending)} pending transactions")
-    return jsonify(response), 200
+    return app.response_class(orjson.dumps(response), mimetype='application/json'), 200
 
 
 @app.route('/chain', methods=['GET'])
 def full_chain():
-    response = {
-        'chain': blockchain.chain,
-        'length': len(blockchain.chain),
-        'valid': blockchain.is_valid_chain(blockchain.chain)
-    }
-    return jsonify(response), 200
+    chain = list(blockchain.chain)
+    valid = blockchain.is_chain_valid()
+
+    def generate():
+        # One block at a time, so peers can start parsing before the whole chain is serialised
+        yield b'{"length":%d,"chain":[' % len(chain)
+        for i, block in enumerate(chain):
+            yield b',' + orjson.dumps(block) if i else orjson.dumps(block)
+        yield b'],"valid":%s}' % (b'true' if valid else b'false')
+
+    return app.response_class(generate(), mimetype='application/json'), 200
 
 
 @app.route('/block/<int:index>', methods=['GET'])
@@ -0,0 +1,16 @@
+import os
+
+# Run with:  gunicorn -c gunicorn_conf.py blockchain:app
+bind = f"{os.getenv('BLOCKCHAIN_HOST', '0.0.0.0')}:{os.getenv('BLOCKCHAIN_PORT', 8080)}"
+
+# The chain lives in process memory, so every extra worker is an independent node with its own chain.
+# Keep one worker and scale with threads; mining already fans out to its own processes.
+workers = int(os.getenv('GUNICORN_WORKERS', 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Must stay off: a preloaded app would mine the genesis block in the master and fork copies of it
+preload_app = False
+
+# /nodes/resolve waits on peers and /chain streams the whole chain
+timeout = 120
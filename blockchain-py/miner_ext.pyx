@@ -0,0 +1,75 @@
+# cython: language_level=3
+# distutils: libraries = crypto
+#
+# Native mining kernel. Build in place with:  cythonize -i miner_ext.pyx
+
+from libc.stdio cimport snprintf
+
+cdef extern from "openssl/evp.h" nogil:
+    ctypedef struct EVP_MD:
+        pass
+    ctypedef struct EVP_MD_CTX:
+        pass
+    ctypedef struct ENGINE:
+        pass
+
+    const EVP_MD *EVP_sha256()
+    EVP_MD_CTX *EVP_MD_CTX_new()
+    void EVP_MD_CTX_free(EVP_MD_CTX *ctx)
+    int EVP_MD_CTX_copy_ex(EVP_MD_CTX *out, const EVP_MD_CTX *src)
+    int EVP_DigestInit_ex(EVP_MD_CTX *ctx, const EVP_MD *md, ENGINE *impl)
+    int EVP_DigestUpdate(EVP_MD_CTX *ctx, const void *data, size_t count)
+    int EVP_DigestFinal_ex(EVP_MD_CTX *ctx, unsigned char *md, unsigned int *size)
+
+
+cdef inline bint meets_difficulty(const unsigned char *digest, unsigned int bits) noexcept nogil:
+    cdef unsigned int i = 0
+    while bits >= 8:
+        if digest[i] != 0:
+            return False
+        i += 1
+        bits -= 8
+    return bits == 0 or (digest[i] >> (8 - bits)) == 0
+
+
+def mine_native(bytes block_bytes, unsigned int difficulty_bits, unsigned long long start,
+                unsigned long long stride, unsigned long long count):
+    """Try `count` nonces from `start` in steps of `stride`; return the first whose
+    digest has `difficulty_bits` leading zero bits, or None if the batch is exhausted."""
+    cdef const char *prefix = block_bytes
+    cdef size_t prefix_len = len(block_bytes)
+    cdef unsigned char digest[32]
+    cdef unsigned int digest_len
+    cdef char nonce_buf[24]
+    cdef int nonce_len
+    cdef unsigned long long nonce = start
+    cdef unsigned long long i
+    cdef bint found = False
+    cdef EVP_MD_CTX *template_ctx
+    cdef EVP_MD_CTX *ctx
+
+    if difficulty_bits > 256:
+        raise ValueError("difficulty_bits must not exceed the 256 bits of a SHA256 digest")
+
+    template_ctx = EVP_MD_CTX_new()
+    ctx = EVP_MD_CTX_new()
+    try:
+        if template_ctx == NULL or ctx == NULL:
+            raise MemoryError()
+        with nogil:
+            EVP_DigestInit_ex(template_ctx, EVP_sha256(), NULL)
+            EVP_DigestUpdate(template_ctx, prefix, prefix_len)
+            for i in range(count):
+                EVP_MD_CTX_copy_ex(ctx, template_ctx)
+                nonce_len = snprintf(nonce_buf, sizeof(nonce_buf), "%llu", nonce)
+                EVP_DigestUpdate(ctx, nonce_buf, nonce_len)
+                EVP_DigestFinal_ex(ctx, digest, &digest_len)
+                if meets_difficulty(digest, difficulty_bits):
+                    found = True
+                    break
+                nonce += stride
+    finally:
+        EVP_MD_CTX_free(ctx)
+        EVP_MD_CTX_free(template_ctx)
+
+    return nonce if found else None
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from _miner_isal import ffi, lib
+
+BATCH_SIZE = 1 << 16
+
+
+def mine_isal(block_bytes: bytes, difficulty_bits: int, start: int, stride: int, count: int) -> Optional[int]:
+    nonce = ffi.new('uint64_t *')
+    found = lib.mine_isal(block_bytes, len(block_bytes), difficulty_bits, start, stride, count, nonce)
+    if found < 0:
+        raise MemoryError("ISA-L mining kernel could not allocate its buffers")
+    return nonce[0] if found else None
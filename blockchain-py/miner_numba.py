@@ -0,0 +1,150 @@
+import numpy as np
+from numba import get_num_threads, njit, prange
+from typing import Optional
+
+# FIPS 180-4 round constants and initial hash value
+_K = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+], dtype=np.int64)
+
+_H0 = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+], dtype=np.int64)
+
+_MASK = 0xFFFFFFFF
+BATCH_SIZE = 1 << 20
+
+
+# Words are kept in int64 and masked to 32 bits, which sidesteps numba's signed/unsigned promotion rules
+@njit(inline='always')
+def _rotr(x, n):
+    return ((x >> n) | (x << (32 - n))) & _MASK
+
+
+@njit
+def _compress(state, msg, offset, w):
+    for t in range(16):
+        i = offset + 4 * t
+        w[t] = (msg[i] << 24) | (msg[i + 1] << 16) | (msg[i + 2] << 8) | msg[i + 3]
+    for t in range(16, 64):
+        s0 = _rotr(w[t - 15], 7) ^ _rotr(w[t - 15], 18) ^ (w[t - 15] >> 3)
+        s1 = _rotr(w[t - 2], 17) ^ _rotr(w[t - 2], 19) ^ (w[t - 2] >> 10)
+        w[t] = (w[t - 16] + s0 + w[t - 7] + s1) & _MASK
+
+    a, b, c, d, e, f, g, h = state[0], state[1], state[2], state[3], state[4], state[5], state[6], state[7]
+    for t in range(64):
+        s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        ch = (e & f) ^ (~e & g & _MASK)
+        temp1 = (h + s1 + ch + _K[t] + w[t]) & _MASK
+        s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        temp2 = (s0 + maj) & _MASK
+        h = g
+        g = f
+        f = e
+        e = (d + temp1) & _MASK
+        d = c
+        c = b
+        b = a
+        a = (temp1 + temp2) & _MASK
+
+    state[0] = (state[0] + a) & _MASK
+    state[1] = (state[1] + b) & _MASK
+    state[2] = (state[2] + c) & _MASK
+    state[3] = (state[3] + d) & _MASK
+    state[4] = (state[4] + e) & _MASK
+    state[5] = (state[5] + f) & _MASK
+    state[6] = (state[6] + g) & _MASK
+    state[7] = (state[7] + h) & _MASK
+
+
+@njit
+def _meets_difficulty(state, bits):
+    word = 0
+    while bits >= 32:
+        if state[word] != 0:
+            return False
+        word += 1
+        bits -= 32
+    return bits == 0 or (state[word] >> (32 - bits)) == 0
+
+
+@njit
+def _midstate(prefix, w):
+    # State after every complete 64-byte block of the prefix; identical for all nonces of a block
+    state = _H0.copy()
+    head_len = (prefix.shape[0] // 64) * 64
+    for offset in range(0, head_len, 64):
+        _compress(state, prefix, offset, w)
+    return state, head_len
+
+
+@njit
+def _hash_with_nonce(midstate, head_len, tail_len, nonce, msg, state, w, difficulty_bits):
+    # msg already holds the prefix tail; append the ASCII nonce and SHA256 padding behind it
+    digits = 1
+    rest = nonce // 10
+    while rest > 0:
+        digits += 1
+        rest //= 10
+    length = tail_len + digits
+    rest = nonce
+    for i in range(length - 1, tail_len - 1, -1):
+        msg[i] = 48 + rest % 10
+        rest //= 10
+
+    padded = ((length + 9 + 63) // 64) * 64
+    msg[length] = 0x80
+    for i in range(length + 1, padded - 8):
+        msg[i] = 0
+    bit_length = (head_len + length) * 8
+    for i in range(8):
+        msg[padded - 1 - i] = (bit_length >> (8 * i)) & 0xFF
+
+    for i in range(8):
+        state[i] = midstate[i]
+    for offset in range(0, padded, 64):
+        _compress(state, msg, offset, w)
+    return _meets_difficulty(state, difficulty_bits)
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _mine_kernel(prefix, difficulty_bits, start, stride, count, chunks):
+    midstate, head_len = _midstate(prefix, np.empty(64, dtype=np.int64))
+    tail_len = prefix.shape[0] - head_len
+    hits = np.full(chunks, -1, dtype=np.int64)
+    # Set by whichever chunk hits first so the others stop early; a stale read only costs a few extra hashes
+    found = np.zeros(1, dtype=np.int64)
+    for chunk in prange(chunks):
+        # Per attempt only the tail (< 64 bytes), up to 20 nonce digits and the padding are compressed
+        msg = np.zeros(64 + 20 + 72, dtype=np.int64)
+        msg[:tail_len] = prefix[head_len:]
+        state = np.empty(8, dtype=np.int64)
+        w = np.empty(64, dtype=np.int64)
+        # One chunk per thread, interleaved so every thread advances through the low nonces together
+        for k in range(chunk, count, chunks):
+            if found[0]:
+                break
+            if _hash_with_nonce(midstate, head_len, tail_len, start + k * stride, msg, state, w, difficulty_bits):
+                hits[chunk] = k
+                found[0] = 1
+                break
+
+    best = -1
+    for chunk in range(chunks):
+        if hits[chunk] >= 0 and (best < 0 or hits[chunk] < best):
+            best = hits[chunk]
+    return -1 if best < 0 else start + best * stride
+
+
+def mine_numba(block_bytes: bytes, difficulty_bits: int, start: int, stride: int, count: int) -> Optional[int]:
+    prefix = np.frombuffer(block_bytes, dtype=np.uint8).astype(np.int64)
+    nonce = _mine_kernel(prefix, difficulty_bits, start, stride, count, get_num_threads())
+    return None if nonce < 0 else int(nonce)
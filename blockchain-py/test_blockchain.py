@@ -0,0 +1,122 @@
+import copy
+import io
+import json
+import socket
+import threading
+import time
+import unittest
+from unittest import mock
+
+import ijson
+import requests
+
+from blockchain import Blockchain, blockchain
+
+
+class PeerChainValidationTest(unittest.TestCase):
+    # A peer chain must be rejected, never raise, whatever values it carries
+
+    def setUp(self):
+        self.chain = copy.deepcopy(blockchain.chain[:1])
+        # Validation needs no state, so skip __init__ and its genesis mining
+        self.validator = Blockchain.__new__(Blockchain)
+
+    def _with_transaction(self, **fields):
+        tx = {'sender': 'alice', 'recipient': 'bob', 'amount': 1}
+        tx.update(fields)
+        self.chain[0]['transactions'] = [tx]
+        return self.chain
+
+    def _assert_rejected(self, chain):
+        self.assertFalse(self.validator.is_valid_chain(chain))
+        # json rather than orjson: orjson refuses integers beyond 64 bits, which a hostile peer can still send
+        stream = io.BytesIO(json.dumps({'chain': chain}).encode())
+        try:
+            self.assertIsNone(self.validator._read_chain(stream))
+        except ijson.JSONError:
+            # The C parser gives up on huge integers itself; _fetch_chain reports that as a malformed chain
+            pass
+
+    def test_local_chain_is_valid(self):
+        self.assertTrue(self.validator.is_valid_chain(self.chain))
+
+    def test_index_beyond_u64_is_rejected(self):
+        self.chain[0]['index'] = 1 << 64
+        self._assert_rejected(self.chain)
+
+    def test_timestamp_beyond_double_is_rejected(self):
+        self.chain[0]['timestamp'] = 10 ** 400
+        self._assert_rejected(self.chain)
+
+    def test_amount_beyond_double_is_rejected(self):
+        self._assert_rejected(self._with_transaction(amount=10 ** 400))
+
+    def test_sender_longer_than_length_prefix_is_rejected(self):
+        self._assert_rejected(self._with_transaction(sender='a' * 65536))
+
+    def test_recipient_longer_than_length_prefix_is_rejected(self):
+        self._assert_rejected(self._with_transaction(recipient='é' * 40000))
+
+
+class PeerFetchTest(unittest.TestCase):
+    # A misbehaving peer must cost one missing candidate, never an exception out of resolve_conflicts
+
+    def setUp(self):
+        self.validator = Blockchain.__new__(Blockchain)
+        self.validator._http = requests.Session()
+        self.addCleanup(self.validator._http.close)
+        self.body = json.dumps({'chain': blockchain.chain[:1], 'length': 1}).encode()
+
+    def _serve_once(self, send_body):
+        server = socket.create_server(('127.0.0.1', 0))
+        self.addCleanup(server.close)
+
+        def handle():
+            connection, _ = server.accept()
+            with connection:
+                connection.recv(65536)
+                connection.sendall(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                                   b'Content-Length: %d\r\n\r\n' % len(self.body))
+                send_body(connection)
+
+        worker = threading.Thread(target=handle, daemon=True)
+        worker.start()
+        self.addCleanup(worker.join, 5)
+        return '127.0.0.1:%d' % server.getsockname()[1]
+
+    def test_complete_body_is_read(self):
+        node = self._serve_once(lambda connection: connection.sendall(self.body))
+        self.assertEqual(self.validator._fetch_chain(node), (node, blockchain.chain[:1]))
+
+    def test_truncated_body_is_skipped(self):
+        node = self._serve_once(lambda connection: connection.sendall(self.body[:len(self.body) // 2]))
+        self.assertIsNone(self.validator._fetch_chain(node))
+
+    def test_stalled_body_is_skipped(self):
+        def stall(connection):
+            connection.sendall(self.body[:len(self.body) // 2])
+            time.sleep(1)
+
+        node = self._serve_once(stall)
+        with mock.patch('blockchain.PEER_TIMEOUT', 0.2):
+            self.assertIsNone(self.validator._fetch_chain(node))
+
+    def test_dripping_body_hits_the_deadline(self):
+        stop = threading.Event()
+
+        def drip(connection):
+            for byte in self.body:
+                if stop.wait(0.05):
+                    return
+                connection.sendall(bytes([byte]))
+
+        node = self._serve_once(drip)
+        self.addCleanup(stop.set)
+        started = time.monotonic()
+        with mock.patch('blockchain.PEER_TIMEOUT', 0.5), mock.patch('blockchain.PEER_FETCH_DEADLINE', 0.5):
+            self.assertIsNone(self.validator._fetch_chain(node))
+        self.assertLess(time.monotonic() - started, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
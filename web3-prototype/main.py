@@ -13,6 +13,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.demos.basic_demo import run_basic_demo
+from src.demos.async_demo import run_async_demo
 
 
 def show_available_demos():
@@ -20,9 +21,10 @@ def show_available_demos():
     print("\n🚀 Web3.py Learning Project")
     print("Available demos:")
     print("  1. Basic Demo - Connections, accounts, and transactions")
-    print("  2. [Coming Soon] Smart Contracts Demo")
-    print("  3. [Coming Soon] Events and Logs Demo")
-    print("  4. [Coming Soon] Advanced Features Demo")
+    print("  2. Async Demo - Concurrent RPC calls with AsyncWeb3")
+    print("  3. [Coming Soon] Smart Contracts Demo")
+    print("  4. [Coming Soon] Events and Logs Demo")
+    print("  5. [Coming Soon] Advanced Features Demo")
     print("\nUsage: python main.py [demo_number]")
     print("       python main.py          # Run basic demo")
 
@@ -38,6 +40,8 @@ def main():
     
     if demo_choice == "1" or demo_choice.lower() == "basic":
         return run_basic_demo()
+    elif demo_choice == "2" or demo_choice.lower() == "async":
+        return run_async_demo()
     elif demo_choice == "help" or demo_choice == "-h" or demo_choice == "--help":
         show_available_demos()
         return True
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Optional, Tuple
+from web3.exceptions import Web3Exception
+from eth_typing import ChecksumAddress
+from .manager import BaseAccountManager
+
+
+class AsyncAccountManager(BaseAccountManager):
+    """AsyncWeb3 account manager whose independent reads run concurrently"""
+    
+    async def get_balance(self, address: ChecksumAddress) -> Optional[int]:
+        """Get account balance with error handling"""
+        try:
+            return await self.w3.eth.get_balance(address)
+        except Web3Exception as e:
+            self.display.show_error(f"Failed to get balance for {address}", e)
+            return None
+    
+    async def get_transaction_count(self, address: ChecksumAddress) -> Optional[int]:
+        """Get transaction count with error handling"""
+        try:
+            return await self.w3.eth.get_transaction_count(address)
+        except Web3Exception as e:
+            self.display.show_error(f"Failed to get transaction count for {address}", e)
+            return None
+    
+    async def display_account_details(self, address: ChecksumAddress, label: str = None) -> bool:
+        """Display account details, fetching balance and transaction count concurrently"""
+        balance, tx_count = await asyncio.gather(
+            self.get_balance(address),
+            self.get_transaction_count(address)
+        )
+        return self._show_account_details(address, balance, tx_count, label)
+    
+    async def display_indexed_account(self, accounts: Tuple[ChecksumAddress, ...],
+                                      account_index: int) -> bool:
+        """Display account details by index with bounds checking"""
+        if not self._check_account_index(accounts, account_index):
+            return False
+        
+        return await self.display_account_details(accounts[account_index], self._account_label(account_index))
@@ -1,24 +1,111 @@
-from typing import Optional, Tuple
-from web3 import Web3
-from web3.exceptions import Web3Exception
+from functools import cached_property
+from time import monotonic
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from web3 import AsyncWeb3, Web3
+from web3.contract import Contract
+from web3.exceptions import BadFunctionCallOutput, Web3Exception
 from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress
+from ..config import Web3Config
 from ..utils.display import ConsoleDisplay
-from ..utils.security import SecurityManager
+from ..utils.rpc import batch_responses, batched_quantity
+from ..utils.security import default_security
 
+# Multicall3 is deployed at the same address on most public chains
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+# Minimal ABI: only the calls used for bulk balance reads
+MULTICALL3_ABI = [
+    {
+        'name': 'getEthBalance',
+        'type': 'function',
+        'stateMutability': 'view',
+        'inputs': [{'name': 'addr', 'type': 'address'}],
+        'outputs': [{'name': 'balance', 'type': 'uint256'}]
+    },
+    {
+        'name': 'aggregate3',
+        'type': 'function',
+        'stateMutability': 'payable',
+        'inputs': [{
+            'name': 'calls',
+            'type': 'tuple[]',
+            'components': [
+                {'name': 'target', 'type': 'address'},
+                {'name': 'allowFailure', 'type': 'bool'},
+                {'name': 'callData', 'type': 'bytes'}
+            ]
+        }],
+        'outputs': [{
+            'name': 'returnData',
+            'type': 'tuple[]',
+            'components': [
+                {'name': 'success', 'type': 'bool'},
+                {'name': 'returnData', 'type': 'bytes'}
+            ]
+        }]
+    }
+]
 
-class AccountManager:
-    """Enhanced account manager with security and error handling"""
+
+class BaseAccountManager:
+    """Provider-independent checks and display steps shared by the sync and async account managers"""
     
-    def __init__(self, w3: Web3, display: ConsoleDisplay = None):
+    def __init__(self, w3: Union[Web3, AsyncWeb3], display: ConsoleDisplay = None):
         self.w3 = w3
         self.display = display or ConsoleDisplay()
-        self.security = SecurityManager()
+        self.security = default_security
+    
+    def display_accounts_list(self, accounts: Tuple[ChecksumAddress, ...]) -> None:
+        """Display list of available accounts"""
+        if accounts:
+            self.display.show_accounts_list(accounts)
+        else:
+            self.display.show_warning("No accounts available")
+    
+    def _show_account_details(self, address: ChecksumAddress, balance: Optional[int],
+                              tx_count: Optional[int], label: str = None) -> bool:
+        """Display fetched account details, or report False when either read failed"""
+        if balance is None or tx_count is None:
+            return False
+        self.display.show_account_details(address, balance, tx_count, label)
+        return True
+    
+    @staticmethod
+    def _account_label(account_index: int) -> str:
+        """Label an account by its 1-based position"""
+        return f"Account #{account_index + 1}"
+    
+    def _check_account_index(self, accounts: Tuple[ChecksumAddress, ...], account_index: int) -> bool:
+        """Report missing accounts or an out-of-range index"""
+        if not accounts:
+            self.display.show_error("No accounts available")
+            return False
+        
+        if account_index < 0 or account_index >= len(accounts):
+            self.display.show_error(f"Account index {account_index} out of range")
+            return False
+        return True
+
+
+class AccountManager(BaseAccountManager):
+    """Enhanced account manager with security and error handling"""
+    
+    def __init__(self, w3: Web3, display: ConsoleDisplay = None):
+        super().__init__(w3, display)
+        # address -> (balance, monotonic fetch time) of the last balance read
+        self._balance_cache: Dict[ChecksumAddress, Tuple[int, float]] = {}
+    
+    @cached_property
+    def _multicall(self) -> Optional[Contract]:
+        """Get the Multicall3 contract, built on first use and set to None once the chain turns out to lack it"""
+        return self.w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
     
     def get_balance(self, address: ChecksumAddress) -> Optional[int]:
         """Get account balance with error handling"""
         try:
-            return self.w3.eth.get_balance(address)
+            balance = self.w3.eth.get_balance(address)
+            self._balance_cache[address] = (balance, monotonic())
+            return balance
         except Web3Exception as e:
             self.display.show_error(f"Failed to get balance for {address}", e)
             return None
@@ -31,37 +118,102 @@ class AccountManager:
             self.display.show_error(f"Failed to get transaction count for {address}", e)
             return None
     
-    def display_accounts_list(self, accounts: Tuple[ChecksumAddress, ...]) -> None:
-        """Display list of available accounts"""
-        if accounts:
-            self.display.show_accounts_list(accounts)
-        else:
+    def get_balance_and_nonce_batch(self, address: ChecksumAddress) -> Tuple[Optional[int], Optional[int]]:
+        """Get balance and transaction count in a single JSON-RPC batch round-trip"""
+        return self.get_balances_and_nonces_batch([address])[0]
+    
+    def get_balances_and_nonces_batch(self, addresses: Sequence[ChecksumAddress]
+                                      ) -> List[Tuple[Optional[int], Optional[int]]]:
+        """Get balance and transaction count of every address in a single JSON-RPC batch round-trip"""
+        calls = []
+        for address in addresses:
+            calls.append(('eth_getBalance', [address, 'latest']))
+            calls.append(('eth_getTransactionCount', [address, 'latest']))
+        
+        responses = batch_responses(self.w3, calls)
+        if responses is None:
+            # In-process providers have no round-trip to save, and nodes refusing batches get the individual calls
+            return [(self.get_balance(address), self.get_transaction_count(address)) for address in addresses]
+        
+        # A call that fails inside the batch is retried on its own
+        fetched_at = monotonic()
+        balances_and_nonces = []
+        for address, balance_response, tx_count_response in zip(addresses, responses[::2], responses[1::2]):
+            balance = batched_quantity(balance_response, lambda: self.get_balance(address))
+            if balance is not None:
+                self._balance_cache[address] = (balance, fetched_at)
+            tx_count = batched_quantity(tx_count_response, lambda: self.get_transaction_count(address))
+            balances_and_nonces.append((balance, tx_count))
+        return balances_and_nonces
+    
+    def get_balance_cached(self, address: ChecksumAddress) -> Optional[int]:
+        """Get account balance, reusing a read from the last BALANCE_CACHE_TTL seconds"""
+        cached = self._balance_cache.get(address)
+        if cached is not None and monotonic() - cached[1] < Web3Config.BALANCE_CACHE_TTL:
+            return cached[0]
+        return self.get_balance(address)
+    
+    def get_balances_multicall(self, addresses: Sequence[ChecksumAddress]) -> List[Optional[int]]:
+        """Get balances of many addresses in one eth_call through Multicall3, falling back to per-address reads"""
+        if self._multicall is not None and addresses:
+            calls = [
+                (MULTICALL3_ADDRESS, False, self._multicall.encode_abi(fn_name='getEthBalance', args=[address]))
+                for address in addresses
+            ]
+            try:
+                results = self._multicall.functions.aggregate3(calls).call()
+            except BadFunctionCallOutput:
+                # No contract code at the Multicall3 address, e.g. EthereumTesterProvider
+                self._multicall = None
+            except Web3Exception as e:
+                self.display.show_warning(f"Multicall3 balance query failed, querying one by one: {e}")
+            else:
+                fetched_at = monotonic()
+                balances = [int.from_bytes(return_data, 'big') for _, return_data in results]
+                for address, balance in zip(addresses, balances):
+                    self._balance_cache[address] = (balance, fetched_at)
+                return balances
+        
+        return [self.get_balance(address) for address in addresses]
+    
+    def display_accounts_list_with_balances(self, accounts: Tuple[ChecksumAddress, ...]) -> bool:
+        """Display available accounts with their balances, fetched in one Multicall3 query"""
+        if not accounts:
             self.display.show_warning("No accounts available")
+            return False
+        
+        balances = self.get_balances_multicall(accounts)
+        if any(balance is None for balance in balances):
+            return False
+        self.display.show_accounts_list_with_balances(accounts, balances)
+        return True
     
     def display_account_details(self, address: ChecksumAddress, label: str = None) -> bool:
         """Display account details with error handling"""
-        balance = self.get_balance(address)
-        tx_count = self.get_transaction_count(address)
-        
-        if balance is not None and tx_count is not None:
-            self.display.show_account_details(address, balance, tx_count, label)
-            return True
-        return False
+        balance, tx_count = self.get_balance_and_nonce_batch(address)
+        return self._show_account_details(address, balance, tx_count, label)
     
     def display_indexed_account(self, accounts: Tuple[ChecksumAddress, ...], 
                               account_index: int) -> bool:
         """Display account details by index with bounds checking"""
-        if not accounts:
-            self.display.show_error("No accounts available")
+        if not self._check_account_index(accounts, account_index):
             return False
         
-        if account_index < 0 or account_index >= len(accounts):
-            self.display.show_error(f"Account index {account_index} out of range")
+        return self.display_account_details(accounts[account_index], self._account_label(account_index))
+    
+    def display_indexed_accounts(self, accounts: Tuple[ChecksumAddress, ...],
+                                 account_indices: Sequence[int]) -> bool:
+        """Display details of several accounts by index, fetched in one batch round-trip"""
+        if not all(self._check_account_index(accounts, account_index) for account_index in account_indices):
             return False
         
-        address = accounts[account_index]
-        label = f"Account #{account_index + 1}"
-        return self.display_account_details(address, label)
+        addresses = [accounts[account_index] for account_index in account_indices]
+        displayed = [
+            self._show_account_details(address, balance, tx_count, self._account_label(account_index))
+            for account_index, address, (balance, tx_count)
+            in zip(account_indices, addresses, self.get_balances_and_nonces_batch(addresses))
+        ]
+        return all(displayed)
     
     def create_new_account(self, display_private_key: bool = False) -> Optional[LocalAccount]:
         """Create a new Ethereum account with security considerations"""
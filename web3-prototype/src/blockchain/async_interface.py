@@ -0,0 +1,96 @@
+import asyncio
+from typing import Optional, Dict, Any
+from web3 import AsyncWeb3
+from web3.exceptions import Web3Exception
+from ..config import Web3Config
+from ..utils.async_pool import PooledAsyncHTTPProvider, get_pooled_session, close_pooled_session
+from ..utils.display import ConsoleDisplay
+
+
+class AsyncEthereumBlockchainInterface:
+    """AsyncWeb3 blockchain interface whose HTTP calls share one pooled aiohttp session"""
+    
+    def __init__(self, provider_type: str = None, display: ConsoleDisplay = None):
+        self.config = Web3Config()
+        self.display = display or ConsoleDisplay()
+        
+        try:
+            cfg = self.config.get_async_provider_config(provider_type)
+            self.w3 = AsyncWeb3(cfg.cls(*cfg.args, **cfg.kwargs))
+        
+        except Exception as e:
+            self.display.show_error("Failed to initialize AsyncWeb3 provider", e)
+            raise
+    
+    async def connect(self) -> bool:
+        """Attach the pooled session (HTTP providers only) and check the connection"""
+        if isinstance(self.w3.provider, PooledAsyncHTTPProvider):
+            session = await get_pooled_session(self.config.ASYNC_CONNECTION_LIMIT_PER_HOST)
+            await self.w3.provider.set_pooled_session(session)
+        return await self.check_connection()
+    
+    async def close(self) -> None:
+        """Release pooled connections"""
+        await close_pooled_session()
+    
+    async def check_connection(self) -> bool:
+        """Check if connected to Ethereum network with error handling"""
+        try:
+            is_connected = await self.w3.is_connected()
+            self.display.show_connection_status(is_connected)
+            return is_connected
+        except Web3Exception as e:
+            self.display.show_error("Connection check failed", e)
+            return False
+    
+    async def get_blockchain_info(self) -> Optional[Dict[str, Any]]:
+        """Get block number and latest block concurrently"""
+        try:
+            block_number, latest_block = await asyncio.gather(
+                self.w3.eth.block_number,
+                self.w3.eth.get_block('latest')
+            )
+            
+            return {
+                'block_number': block_number,
+                'latest_block': latest_block
+            }
+        
+        except Web3Exception as e:
+            self.display.show_error("Failed to retrieve blockchain information", e)
+            return None
+    
+    async def display_blockchain_info(self) -> None:
+        """Display blockchain information"""
+        info = await self.get_blockchain_info()
+        if info:
+            self.display.show_blockchain_info(
+                info['block_number'],
+                info['latest_block']
+            )
+    
+    async def get_accounts(self) -> Optional[tuple]:
+        """Get available accounts with error handling"""
+        try:
+            return tuple(await self.w3.eth.accounts)
+        except Web3Exception as e:
+            self.display.show_error("Failed to retrieve accounts", e)
+            return None
+    
+    async def get_gas_price(self) -> Optional[int]:
+        """Get current gas price with error handling"""
+        try:
+            return await self.w3.eth.gas_price
+        except Web3Exception as e:
+            self.display.show_error("Failed to retrieve gas price", e)
+            return None
+    
+    async def estimate_gas(self, transaction: Dict[str, Any]) -> Optional[int]:
+        """Estimate gas for transaction with error handling"""
+        try:
+            estimated = await self.w3.eth.estimate_gas(transaction)
+            # Apply safety multiplier
+            return int(estimated * self.config.DEFAULT_GAS_MULTIPLIER)
+        except Web3Exception as e:
+            self.display.show_error("Gas estimation failed", e)
+            return None
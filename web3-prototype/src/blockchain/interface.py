@@ -1,4 +1,5 @@
-from typing import Optional, Dict, Any
+from time import monotonic
+from typing import Optional, Dict, Any, Tuple
 from web3 import Web3
 from web3.types import BlockData
 from web3.exceptions import Web3Exception
@@ -12,14 +13,13 @@ class EthereumBlockchainInterface:
     def __init__(self, provider_type: str = None, display: ConsoleDisplay = None):
         self.config = Web3Config()
         self.display = display or ConsoleDisplay()
+        # Accounts are fixed for the provider's lifetime; chain info is kept as (monotonic fetch time, info)
+        self._accounts_cache: Optional[tuple] = None
+        self._blockchain_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         
         try:
-            provider_config = self.config.get_provider_config(provider_type)
-            provider_class = provider_config['provider_class']
-            provider_args = provider_config['provider_args']
-            provider_kwargs = provider_config['provider_kwargs']
-            
-            self.w3 = Web3(provider_class(*provider_args, **provider_kwargs))
+            cfg = self.config.get_provider_config(provider_type)
+            self.w3 = Web3(cfg.cls(*cfg.args, **cfg.kwargs))
             
         except Exception as e:
             self.display.show_error("Failed to initialize Web3 provider", e)
@@ -35,8 +35,16 @@ class EthereumBlockchainInterface:
             self.display.show_error("Connection check failed", e)
             return False
     
+    def invalidate(self) -> None:
+        """Drop cached chain info so the next read reflects new transactions"""
+        self._blockchain_info_cache = None
+    
     def get_blockchain_info(self) -> Optional[Dict[str, Any]]:
-        """Get current blockchain information with error handling"""
+        """Get current blockchain information, reusing a read from the last BLOCKCHAIN_INFO_CACHE_TTL seconds"""
+        cached = self._blockchain_info_cache
+        if cached is not None and monotonic() - cached[0] < self.config.BLOCKCHAIN_INFO_CACHE_TTL:
+            return cached[1]
+        
         try:
             block_number = self.w3.eth.block_number
             latest_block = self.w3.eth.get_block('latest')
@@ -46,6 +54,7 @@ class EthereumBlockchainInterface:
                 'latest_block': latest_block
             }
             
+            self._blockchain_info_cache = (monotonic(), blockchain_info)
             return blockchain_info
             
         except Web3Exception as e:
@@ -62,9 +71,12 @@ class EthereumBlockchainInterface:
             )
     
     def get_accounts(self) -> Optional[tuple]:
-        """Get available accounts with error handling"""
+        """Get available accounts with error handling, fetched once per interface"""
+        if self._accounts_cache is not None:
+            return self._accounts_cache
         try:
-            return self.w3.eth.accounts
+            self._accounts_cache = self.w3.eth.accounts
+            return self._accounts_cache
         except Web3Exception as e:
             self.display.show_error("Failed to retrieve accounts", e)
             return None
@@ -1,5 +1,11 @@
-from web3 import Web3
-from typing import Dict, Any
+from collections import namedtuple
+from functools import lru_cache
+from web3 import HTTPProvider, Web3
+from web3.providers.eth_tester import AsyncEthereumTesterProvider
+from .utils.http_pool import get_pooled_http_session
+
+# Provider class with the positional and keyword arguments to build it with
+ProviderCfg = namedtuple('ProviderCfg', 'cls args kwargs')
 
 
 class Web3Config:
@@ -10,11 +16,26 @@ class Web3Config:
     DEFAULT_GAS_MULTIPLIER = 1.2
     
     # ETH unit constants
-    ONE_ETH_WEI = Web3.to_wei(1, 'ether')
-    TWO_ETH_WEI = Web3.to_wei(2, 'ether')
+    ONE_ETH_WEI = 1_000_000_000_000_000_000
+    TWO_ETH_WEI = 2_000_000_000_000_000_000
     
     # Network settings
     DEFAULT_PROVIDER = 'tester'
+    DEFAULT_HTTP_ENDPOINT = 'http://127.0.0.1:8545'
+    
+    # HTTP settings (sync provider keep-alive pool)
+    HTTP_POOL_CONNECTIONS = 10
+    HTTP_POOL_MAXSIZE = 20
+    HTTP_MAX_RETRIES = 3
+    HTTP_RETRY_BACKOFF = 0.1
+    HTTP_REQUEST_TIMEOUT = 10
+    
+    # Async settings
+    ASYNC_CONNECTION_LIMIT_PER_HOST = 20
+    
+    # Cache settings
+    BALANCE_CACHE_TTL = 2.0
+    BLOCKCHAIN_INFO_CACHE_TTL = 0.25
     
     # Security settings
     WARN_ON_PRIVATE_KEY_DISPLAY = True
@@ -23,19 +44,41 @@ class Web3Config:
     ETH_DECIMAL_PLACES = 8
     
     @classmethod
-    def get_provider_config(cls, provider_type: str = None) -> Dict[str, Any]:
-        """Get provider configuration based on type"""
+    @lru_cache(maxsize=8)
+    def get_provider_config(cls, provider_type: str = None) -> ProviderCfg:
+        """Get provider configuration based on type, built once per type"""
         provider_type = provider_type or cls.DEFAULT_PROVIDER
         
-        configs = {
-            'tester': {
-                'provider_class': Web3.EthereumTesterProvider,
-                'provider_args': (),
-                'provider_kwargs': {}
-            },
+        # Entries are built on demand, so only the requested provider's resources are created
+        builders = {
+            'tester': lambda: ProviderCfg(Web3.EthereumTesterProvider, (), {}),
+            # One keep-alive session is shared by every HTTP provider in the process
+            'http': lambda: ProviderCfg(HTTPProvider, (cls.DEFAULT_HTTP_ENDPOINT,), {
+                'session': get_pooled_http_session(
+                    cls.HTTP_POOL_CONNECTIONS, cls.HTTP_POOL_MAXSIZE,
+                    cls.HTTP_MAX_RETRIES, cls.HTTP_RETRY_BACKOFF
+                ),
+                'request_kwargs': {'timeout': cls.HTTP_REQUEST_TIMEOUT}
+            }),
             # Future providers can be added here
-            # 'infura': {...},
-            # 'alchemy': {...},
+            # 'infura': lambda: ProviderCfg(HTTPProvider, (infura_url,), {...}),
+            # 'alchemy': lambda: ProviderCfg(HTTPProvider, (alchemy_url,), {...}),
+        }
+        
+        return builders.get(provider_type, builders['tester'])()
+    
+    @classmethod
+    @lru_cache(maxsize=8)
+    def get_async_provider_config(cls, provider_type: str = None) -> ProviderCfg:
+        """Get AsyncWeb3 provider configuration based on type, built once per type"""
+        # Imported here so sync-only users never load utils.async_pool; web3 itself already imports aiohttp
+        from .utils.async_pool import PooledAsyncHTTPProvider
+        
+        provider_type = provider_type or cls.DEFAULT_PROVIDER
+        
+        configs = {
+            'tester': ProviderCfg(AsyncEthereumTesterProvider, (), {}),
+            'http': ProviderCfg(PooledAsyncHTTPProvider, (cls.DEFAULT_HTTP_ENDPOINT,), {}),
         }
         
         return configs.get(provider_type, configs['tester'])
\ No newline at end of file
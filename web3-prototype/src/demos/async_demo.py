@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Async Web3.py demonstration using AsyncWeb3.
+Independent RPC calls run concurrently with asyncio.gather, and HTTP providers share one pooled session.
+"""
+
+import asyncio
+from ..blockchain.async_interface import AsyncEthereumBlockchainInterface
+from ..accounts.async_manager import AsyncAccountManager
+from ..transactions.async_manager import AsyncTransactionManager
+from ..utils.display import ConsoleDisplay
+
+
+async def _run_async_demo(provider_type: str = None) -> bool:
+    """Run the async demo inside an event loop"""
+    
+    display = ConsoleDisplay()
+    display.show_demo_start("Async Ethereum Blockchain Interface Demo")
+    
+    # Initialize components
+    try:
+        eth_interface = AsyncEthereumBlockchainInterface(provider_type, display=display)
+        account_manager = AsyncAccountManager(eth_interface.w3, display=display)
+        tx_manager = AsyncTransactionManager(eth_interface.w3, display=display)
+    except Exception as e:
+        display.show_error("Failed to initialize components", e)
+        return False
+    
+    try:
+        # Check connection
+        if not await eth_interface.connect():
+            display.show_error("Connection failed. Exiting...")
+            return False
+        
+        await eth_interface.display_blockchain_info()
+        
+        accounts = await eth_interface.get_accounts()
+        if not accounts:
+            display.show_error("No accounts available")
+            return False
+        
+        account_manager.display_accounts_list(accounts)
+        
+        # Both accounts are fetched concurrently
+        await asyncio.gather(
+            account_manager.display_indexed_account(accounts, 0),
+            account_manager.display_indexed_account(accounts, 1)
+        )
+        
+        display.show_section_header("Starting Transaction Operations")
+        
+        receipt = await tx_manager.send_transaction(accounts[0], accounts[1], 3.0)
+        if receipt:
+            await eth_interface.display_blockchain_info()
+            await asyncio.gather(
+                account_manager.display_indexed_account(accounts, 0),
+                account_manager.display_indexed_account(accounts, 1)
+            )
+        
+        display.show_demo_completed()
+        return True
+    
+    finally:
+        await eth_interface.close()
+
+
+def run_async_demo(provider_type: str = None) -> bool:
+    """Run the async Web3.py demonstration"""
+    return asyncio.run(_run_async_demo(provider_type))
+
+
+if __name__ == "__main__":
+    success = run_async_demo()
+    exit(0 if success else 1)
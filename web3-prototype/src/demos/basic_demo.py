@@ -42,24 +42,31 @@ def run_basic_demo():
     account_manager.display_accounts_list(accounts)
     
     # Display account details
-    account_manager.display_indexed_account(accounts, 0)
-    account_manager.display_indexed_account(accounts, 1)
+    account_manager.display_indexed_accounts(accounts, [0, 1])
     
     # Transaction operations
     display.show_section_header("Starting Transaction Operations")
     
     # Send transaction between existing accounts
-    receipt = tx_manager.send_transaction(accounts[0], accounts[1], 3.0)
+    # Balances shown just above are reused for the sender's balance check
+    receipt = tx_manager.send_transaction(
+        accounts[0], accounts[1], 3.0,
+        known_sender_balance=account_manager.get_balance_cached(accounts[0])
+    )
     if receipt:
+        eth_interface.invalidate()
         eth_interface.display_blockchain_info()
-        account_manager.display_indexed_account(accounts, 0)
-        account_manager.display_indexed_account(accounts, 1)
+        account_manager.display_indexed_accounts(accounts, [0, 1])
     
     # Create new account and fund it
     new_account = account_manager.create_new_account(display_private_key=True)
     if new_account:
-        receipt = tx_manager.send_transaction(accounts[0], new_account.address, 2.0)
+        receipt = tx_manager.send_transaction(
+            accounts[0], new_account.address, 2.0,
+            known_sender_balance=account_manager.get_balance_cached(accounts[0])
+        )
         if receipt:
+            eth_interface.invalidate()
             eth_interface.display_blockchain_info()
             account_manager.display_indexed_account(accounts, 0)
             account_manager.display_account_details(new_account.address, "New Account")
@@ -69,12 +76,14 @@ def run_basic_demo():
         receipt = tx_manager.send_raw_transaction(
             new_account, 
             accounts[1], 
-            eth_interface.one_eth_wei
+            eth_interface.one_eth_wei,
+            known_sender_balance=account_manager.get_balance_cached(new_account.address),
+            to_validated=True
         )
         if receipt:
+            eth_interface.invalidate()
             eth_interface.display_blockchain_info()
-            account_manager.display_indexed_account(accounts, 0)
-            account_manager.display_indexed_account(accounts, 1)
+            account_manager.display_indexed_accounts(accounts, [0, 1])
             account_manager.display_account_details(new_account.address, "New Account")
     
     display.show_demo_completed()
@@ -0,0 +1,51 @@
+from typing import Optional, Union
+from web3.types import TxReceipt
+from web3.exceptions import Web3Exception
+from eth_typing import ChecksumAddress
+from .manager import BaseTransactionManager
+
+
+class AsyncTransactionManager(BaseTransactionManager):
+    """AsyncWeb3 transaction manager sharing validation and reporting with TransactionManager"""
+    
+    async def send_transaction(self, from_address: ChecksumAddress, to_address: ChecksumAddress,
+                               value_in_eth: Union[int, float],
+                               known_sender_balance: Optional[int] = None) -> Optional[TxReceipt]:
+        """Send ETH from one account to another; a known_sender_balance skips the balance RPC"""
+        
+        if not self._validate_send_params(to_address, value_in_eth):
+            return None
+        
+        try:
+            sender_balance = (known_sender_balance if known_sender_balance is not None
+                              else await self.w3.eth.get_balance(from_address))
+            tx_params = self._prepare_send(from_address, to_address, value_in_eth, sender_balance)
+            if tx_params is None:
+                return None
+            
+            tx_params['gas'] = self._gas_with_margin(await self.w3.eth.estimate_gas(tx_params))
+            tx_hash = await self.w3.eth.send_transaction(tx_params)
+            return await self._process_transaction(tx_hash)
+        
+        except Web3Exception as e:
+            self.display.show_error("Transaction failed", e)
+            return None
+    
+    async def _process_transaction(self, tx_hash: bytes) -> Optional[TxReceipt]:
+        """Wait for transaction completion with error handling"""
+        try:
+            tx_hex = self._report_submitted(tx_hash)
+            
+            # Wait for transaction receipt
+            receipt = await (self.w3.eth.get_transaction_receipt(tx_hash) if self._is_tester
+                             else self.w3.eth.wait_for_transaction_receipt(tx_hash))
+            if not self._check_receipt(receipt):
+                return None
+            
+            # Get full transaction details
+            self.display.show_transaction_completed(await self.w3.eth.get_transaction(tx_hex))
+            return receipt
+        
+        except Web3Exception as e:
+            self.display.show_error("Transaction processing failed", e)
+            return None
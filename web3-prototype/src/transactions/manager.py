@@ -1,62 +1,113 @@
-from typing import Optional, Dict, Any, Union
-from web3 import Web3
-from web3.types import TxReceipt, TxParams
+from typing import Optional, Dict, Tuple, Union
+from web3 import AsyncWeb3, Web3
+from web3.types import TxData, TxReceipt, TxParams
 from web3.exceptions import Web3Exception
+from web3.providers.eth_tester import AsyncEthereumTesterProvider, EthereumTesterProvider
 from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress
 from ..config import Web3Config
 from ..utils.display import ConsoleDisplay
-from ..utils.security import SecurityManager
+from ..utils.rpc import batch_responses, batched_quantity
+from ..utils.security import default_security
 
 
-class TransactionManager:
-    """Enhanced transaction manager with error handling and validation"""
+def _eth_to_wei_fast(value_in_eth: Union[int, float]) -> int:
+    """Convert an ETH amount to Wei, using plain integer math for whole amounts"""
+    if type(value_in_eth) is int:
+        return value_in_eth * Web3Config.ONE_ETH_WEI
+    if type(value_in_eth) is float:
+        if value_in_eth.is_integer():
+            return int(value_in_eth) * Web3Config.ONE_ETH_WEI
+        # Fractional floats go through their shortest repr so 0.3 stays exactly 0.3 ETH
+        return Web3.to_wei(str(value_in_eth), 'ether')
+    return Web3.to_wei(value_in_eth, 'ether')
+
+
+def _tx_hash_hex(tx_hash: Union[bytes, str]) -> str:
+    """Hex-encode a transaction hash once with the C bytes.hex, keeping the 0x prefix"""
+    if isinstance(tx_hash, (bytes, bytearray)):
+        return '0x' + bytes.hex(tx_hash)
+    return str(tx_hash)
+
+
+class BaseTransactionManager:
+    """Provider-independent validation, building and reporting shared by the sync and async transaction managers"""
     
-    def __init__(self, w3: Web3, display: ConsoleDisplay = None):
+    def __init__(self, w3: Union[Web3, AsyncWeb3], display: ConsoleDisplay = None):
         self.w3 = w3
         self.display = display or ConsoleDisplay()
-        self.security = SecurityManager()
+        self.security = default_security
         self.config = Web3Config()
+        # Tester providers mine on submission, so their receipts exist as soon as the hash is returned
+        self._is_tester = isinstance(w3.provider, (EthereumTesterProvider, AsyncEthereumTesterProvider))
     
-    def send_transaction(self, from_address: ChecksumAddress, to_address: ChecksumAddress,
-                        value_in_eth: Union[int, float]) -> Optional[TxReceipt]:
-        """Send ETH from one account to another with improved error handling"""
-        
-        # Validate parameters
+    def _validate_send_params(self, to_address: ChecksumAddress, value_in_eth: Union[int, float]) -> bool:
+        """Validate destination address and amount before sending"""
         if not self.security.validate_address(to_address):
             self.display.show_error(f"Invalid destination address: {to_address}")
-            return None
+            return False
         
         if value_in_eth <= 0:
             self.display.show_error("Transaction value must be positive")
+            return False
+        return True
+    
+    def _prepare_send(self, from_address: ChecksumAddress, to_address: ChecksumAddress,
+                      value_in_eth: Union[int, float], sender_balance: int) -> Optional[TxParams]:
+        """Check the sender covers the amount, announce the transfer and build its parameters"""
+        value_in_wei = _eth_to_wei_fast(value_in_eth)
+        if sender_balance < value_in_wei:
+            self.display.show_error(
+                f"Insufficient balance. Required: {value_in_eth} ETH, "
+                f"Available: {Web3.from_wei(sender_balance, 'ether')} ETH"
+            )
+            return None
+        
+        self.display.show_transaction_initiated(from_address, to_address, value_in_eth)
+        return {
+            'from': from_address,
+            'to': to_address,
+            'value': value_in_wei
+        }
+    
+    def _gas_with_margin(self, estimated_gas: int) -> int:
+        """Apply the safety multiplier to a gas estimate"""
+        return int(estimated_gas * self.config.DEFAULT_GAS_MULTIPLIER)
+    
+    def _report_submitted(self, tx_hash: bytes) -> str:
+        """Display the hash and mining notice, returning the hash hex for follow-up lookups"""
+        tx_hex = _tx_hash_hex(tx_hash)
+        self.display.show_transaction_hash_str(tx_hex)
+        self.display.show_transaction_mining()
+        return tx_hex
+    
+    def _check_receipt(self, receipt: TxReceipt) -> bool:
+        """Report a mined transaction that failed"""
+        if receipt.status == 1:
+            return True
+        self.display.show_error("Transaction was mined but failed")
+        return False
+
+
+class TransactionManager(BaseTransactionManager):
+    """Enhanced transaction manager with error handling and validation"""
+    
+    def send_transaction(self, from_address: ChecksumAddress, to_address: ChecksumAddress,
+                        value_in_eth: Union[int, float],
+                        known_sender_balance: Optional[int] = None) -> Optional[TxReceipt]:
+        """Send ETH from one account to another; a known_sender_balance skips the balance RPC"""
+        
+        if not self._validate_send_params(to_address, value_in_eth):
             return None
         
         try:
-            value_in_wei = Web3.to_wei(value_in_eth, 'ether')
-            
-            # Check sender balance
-            sender_balance = self.w3.eth.get_balance(from_address)
-            if sender_balance < value_in_wei:
-                self.display.show_error(
-                    f"Insufficient balance. Required: {value_in_eth} ETH, "
-                    f"Available: {Web3.from_wei(sender_balance, 'ether')} ETH"
-                )
+            sender_balance = (known_sender_balance if known_sender_balance is not None
+                              else self.w3.eth.get_balance(from_address))
+            tx_params = self._prepare_send(from_address, to_address, value_in_eth, sender_balance)
+            if tx_params is None:
                 return None
             
-            self.display.show_transaction_initiated(from_address, to_address, value_in_eth)
-            
-            # Build transaction
-            tx_params = {
-                'from': from_address,
-                'to': to_address,
-                'value': value_in_wei
-            }
-            
-            # Estimate gas
-            estimated_gas = self.w3.eth.estimate_gas(tx_params)
-            tx_params['gas'] = int(estimated_gas * self.config.DEFAULT_GAS_MULTIPLIER)
-            
-            # Send transaction
+            tx_params['gas'] = self._gas_with_margin(self.w3.eth.estimate_gas(tx_params))
             tx_hash = self.w3.eth.send_transaction(tx_params)
             return self._process_transaction(tx_hash)
             
@@ -65,17 +116,21 @@ class TransactionManager:
             return None
     
     def send_raw_transaction(self, account: LocalAccount, to_address: ChecksumAddress,
-                           value_in_wei: int) -> Optional[TxReceipt]:
-        """Send a raw transaction from a LocalAccount with validation"""
+                           value_in_wei: int, known_sender_balance: Optional[int] = None, *,
+                           to_validated: bool = False) -> Optional[TxReceipt]:
+        """Send a raw transaction from a LocalAccount with validation; to_validated skips the address check"""
         
-        # Validate parameters
-        if not self.security.validate_transaction_params(to_address, value_in_wei):
+        # Validate parameters; addresses taken from the node need no checksum re-verification
+        params_valid = (value_in_wei >= 0 if to_validated
+                        else self.security.validate_transaction_params(to_address, value_in_wei))
+        if not params_valid:
             self.display.show_error("Invalid transaction parameters")
             return None
         
         try:
             # Check balance
-            sender_balance = self.w3.eth.get_balance(account.address)
+            sender_balance = (known_sender_balance if known_sender_balance is not None
+                              else self.w3.eth.get_balance(account.address))
             if sender_balance < value_in_wei:
                 self.display.show_error(
                     f"Insufficient balance. Required: {Web3.from_wei(value_in_wei, 'ether')} ETH, "
@@ -100,11 +155,7 @@ class TransactionManager:
                               value: int) -> Optional[TxParams]:
         """Build a raw transaction object with error handling"""
         try:
-            # Get current gas price
-            gas_price = self.w3.eth.gas_price
-            
-            # Get nonce
-            nonce = self.w3.eth.get_transaction_count(from_address)
+            gas_price, nonce, estimated_gas = self._fetch_raw_transaction_inputs(from_address, to_address, value)
             
             # Build transaction
             tx_params = {
@@ -115,13 +166,9 @@ class TransactionManager:
                 'nonce': nonce
             }
             
-            # Try to estimate gas for better accuracy
-            try:
-                # Create a copy for estimation (without gas field)
-                estimation_params = {k: v for k, v in tx_params.items() if k != 'gas'}
-                estimated_gas = self.w3.eth.estimate_gas(estimation_params)
-                tx_params['gas'] = int(estimated_gas * self.config.DEFAULT_GAS_MULTIPLIER)
-            except (Web3Exception, Exception):
+            if estimated_gas is not None:
+                tx_params['gas'] = self._gas_with_margin(estimated_gas)
+            else:
                 # Fall back to default gas limit
                 self.display.show_warning("Using default gas limit due to estimation failure")
             
@@ -131,34 +178,55 @@ class TransactionManager:
             self.display.show_error("Failed to build transaction", e)
             return None
     
+    def _fetch_raw_transaction_inputs(self, from_address: ChecksumAddress, to_address: ChecksumAddress,
+                                      value: int) -> Tuple[int, int, Optional[int]]:
+        """Fetch gas price, pending nonce and gas estimate, batched into one round-trip when possible"""
+        estimation_params = {'from': from_address, 'to': to_address, 'value': value}
+        
+        # The three calls are independent; a call that fails inside the batch is retried on its own
+        responses = batch_responses(self.w3, [
+            ('eth_gasPrice', []),
+            ('eth_getTransactionCount', [from_address, 'pending']),
+            ('eth_estimateGas', [{'from': from_address, 'to': to_address, 'value': hex(value)}])
+        ]) or [None, None, None]
+        gas_price_response, nonce_response, estimate_response = responses
+        
+        gas_price = batched_quantity(gas_price_response, lambda: self.w3.eth.gas_price)
+        nonce = batched_quantity(nonce_response,
+                                  lambda: self.w3.eth.get_transaction_count(from_address, 'pending'))
+        estimated_gas = batched_quantity(estimate_response, lambda: self._try_estimate_gas(estimation_params))
+        return gas_price, nonce, estimated_gas
+    
+    def _try_estimate_gas(self, tx_params: TxParams) -> Optional[int]:
+        """Estimate gas, returning None instead of raising when estimation fails"""
+        try:
+            return self.w3.eth.estimate_gas(tx_params)
+        except (Web3Exception, Exception):
+            return None
+    
     def _process_transaction(self, tx_hash: bytes) -> Optional[TxReceipt]:
         """Process and wait for transaction completion with error handling"""
         try:
-            self.display.show_transaction_hash(tx_hash)
-            self.display.show_transaction_mining()
+            tx_hex = self._report_submitted(tx_hash)
             
             # Wait for transaction receipt
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-            
-            # Check if transaction was successful
-            if receipt.status == 1:
-                # Get full transaction details
-                transaction = self.w3.eth.get_transaction(tx_hash)
-                self.display.show_transaction_completed(dict(transaction))
-                return receipt
-            else:
-                self.display.show_error("Transaction was mined but failed")
+            receipt = (self.w3.eth.get_transaction_receipt(tx_hash) if self._is_tester
+                       else self.w3.eth.wait_for_transaction_receipt(tx_hash))
+            if not self._check_receipt(receipt):
                 return None
+            
+            # Get full transaction details
+            self.display.show_transaction_completed(self.w3.eth.get_transaction(tx_hex))
+            return receipt
                 
         except Web3Exception as e:
             self.display.show_error("Transaction processing failed", e)
             return None
     
-    def get_transaction_details(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+    def get_transaction_details(self, tx_hash: str) -> Optional[TxData]:
         """Get transaction details by hash"""
         try:
-            transaction = self.w3.eth.get_transaction(tx_hash)
-            return dict(transaction)
+            return self.w3.eth.get_transaction(tx_hash)
         except Web3Exception as e:
             self.display.show_error(f"Failed to get transaction {tx_hash}", e)
             return None
@@ -0,0 +1,29 @@
+from typing import Optional
+from aiohttp import ClientSession, TCPConnector
+from web3 import AsyncHTTPProvider
+
+_pooled_session: Optional[ClientSession] = None
+
+
+async def get_pooled_session(limit_per_host: int) -> ClientSession:
+    """Return the shared aiohttp session, creating it inside the running event loop on first use"""
+    global _pooled_session
+    if _pooled_session is None or _pooled_session.closed:
+        _pooled_session = ClientSession(connector=TCPConnector(limit_per_host=limit_per_host))
+    return _pooled_session
+
+
+async def close_pooled_session() -> None:
+    """Close the shared aiohttp session and its pooled connections"""
+    global _pooled_session
+    if _pooled_session is not None:
+        await _pooled_session.close()
+        _pooled_session = None
+
+
+class PooledAsyncHTTPProvider(AsyncHTTPProvider):
+    """AsyncHTTPProvider that sends every request over an injected, shared aiohttp session"""
+    
+    async def set_pooled_session(self, session: ClientSession) -> None:
+        """Use the given session instead of letting the provider open its own"""
+        await self.cache_async_session(session)
@@ -1,19 +1,25 @@
-from typing import Tuple, List, Dict, Any
-from web3 import Web3
+import sys
+from typing import Tuple, List, Any, Mapping, Optional
 from web3.types import BlockData
 from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress
 from ..config import Web3Config
 
+_WEI_PER_ETH = Web3Config.ONE_ETH_WEI
+# Wei per last displayed decimal place
+_WEI_TRUNC = 10 ** (18 - Web3Config.ETH_DECIMAL_PLACES)
+# Below this many balances the per-call kernel overhead outweighs the per-value Python formatting
+BULK_FORMAT_MIN_BALANCES = 256
+
 
 class DisplayFormatter:
     """Handles all display formatting and console output"""
     
     @staticmethod
     def format_eth_balance(balance_wei: int) -> str:
-        """Format Wei balance to ETH with proper decimal places"""
-        eth_balance = Web3.from_wei(balance_wei, 'ether')
-        return f"{eth_balance:,.{Web3Config.ETH_DECIMAL_PLACES}f} ETH"
+        """Format Wei balance to ETH, truncated to the configured decimal places"""
+        whole, frac = divmod(balance_wei, _WEI_PER_ETH)
+        return f"{whole:,}.{frac // _WEI_TRUNC:0{Web3Config.ETH_DECIMAL_PLACES}d} ETH"
     
     @staticmethod
     def format_address(address: ChecksumAddress, label: str = "Address") -> str:
@@ -30,33 +36,71 @@ class ConsoleDisplay:
     """Handles console output for Web3 operations"""
     
     def __init__(self, formatter: DisplayFormatter = None):
-        self.formatter = formatter or DisplayFormatter()
+        self.formatter = formatter or default_formatter
     
     def show_connection_status(self, is_connected: bool) -> None:
         """Display connection status"""
         status = '✅ Connected' if is_connected else '❌ Not Connected'
         print(f"\n🔌 Connection Status: {status}")
     
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """Write several lines with a single stdout write"""
+        sys.stdout.write("\n".join(lines) + "\n")
+    
     def show_blockchain_info(self, block_number: int, latest_block: BlockData) -> None:
         """Display blockchain information"""
-        print("\n🔗 Blockchain Information:")
-        print(f"  📦 Current Block Number: {block_number}")
-        print(f"  📄 Latest Block: {latest_block}")
+        self._write_lines([
+            "\n🔗 Blockchain Information:",
+            f"  📦 Current Block Number: {block_number}",
+            f"  📄 Latest Block: {latest_block}"
+        ])
     
     def show_accounts_list(self, accounts: Tuple[ChecksumAddress, ...]) -> None:
         """Display list of available accounts"""
-        print("\n👥 Available Ethereum Accounts:")
-        for idx, account in enumerate(accounts, 1):
-            print(f"  🏦 Account #{idx}: {account}")
+        sys.stdout.write(
+            "\n👥 Available Ethereum Accounts:\n"
+            + "".join(f"  🏦 Account #{idx}: {account}\n" for idx, account in enumerate(accounts, 1))
+        )
+    
+    def show_accounts_list_with_balances(self, accounts: Tuple[ChecksumAddress, ...],
+                                         balances_wei: List[int]) -> None:
+        """Display list of available accounts with their balances"""
+        formatted = None
+        if len(balances_wei) >= BULK_FORMAT_MIN_BALANCES:
+            formatted = self._format_eth_balances_bulk(balances_wei)
+        if formatted is None:
+            formatted = [self.formatter.format_eth_balance(balance) for balance in balances_wei]
+        
+        sys.stdout.write(
+            "\n👥 Available Ethereum Accounts:\n"
+            + "".join(f"  🏦 Account #{idx}: {account} 💎 {balance}\n"
+                      for idx, (account, balance) in enumerate(zip(accounts, formatted), 1))
+        )
+    
+    @staticmethod
+    def _format_eth_balances_bulk(balances_wei: List[int]) -> Optional[List[str]]:
+        """Format balances with the numba kernel, or return None when it is unavailable or out of range"""
+        # Imported here so numba and numpy load only once a list is long enough to need them
+        try:
+            from .fastformat import format_eth_balances_bulk
+        except ImportError:
+            return None
+        try:
+            return format_eth_balances_bulk(balances_wei)
+        except (OverflowError, ValueError):
+            return None
     
     def show_account_details(self, address: ChecksumAddress, balance_wei: int, 
                            tx_count: int, label: str = None) -> None:
         """Display account balance and transaction history"""
         account_label = label or f"Account {address}"
-        print(f"\n💰 Balance of {account_label}:")
-        print(f"  💎 {self.formatter.format_eth_balance(balance_wei)}")
-        print(f"\n📝 Transaction History of {account_label}:")
-        print(f"  📊 {self.formatter.format_transaction_count(tx_count)}")
+        self._write_lines([
+            f"\n💰 Balance of {account_label}:",
+            f"  💎 {self.formatter.format_eth_balance(balance_wei)}",
+            f"\n📝 Transaction History of {account_label}:",
+            f"  📊 {self.formatter.format_transaction_count(tx_count)}"
+        ])
     
     def show_transaction_initiated(self, from_addr: ChecksumAddress, 
                                  to_addr: ChecksumAddress, amount_eth: float) -> None:
@@ -65,13 +109,17 @@ class ConsoleDisplay:
     
     def show_transaction_hash(self, tx_hash: bytes) -> None:
         """Display transaction hash"""
-        print(f"  🔍 Transaction Hash: {tx_hash.hex()}")
+        self.show_transaction_hash_str(tx_hash.hex())
+    
+    def show_transaction_hash_str(self, tx_hex: str) -> None:
+        """Display an already hex-encoded transaction hash"""
+        print(f"  🔍 Transaction Hash: {tx_hex}")
     
     def show_transaction_mining(self) -> None:
         """Display mining status"""
         print("⏳ Waiting for transaction to be mined...")
     
-    def show_transaction_completed(self, transaction_data: Dict[str, Any]) -> None:
+    def show_transaction_completed(self, transaction_data: Mapping[str, Any]) -> None:
         """Display completed transaction"""
         print("✅ Transaction has been mined!")
         print(f"  📄 Transaction Details: {transaction_data}")
@@ -108,4 +156,8 @@ class ConsoleDisplay:
     
     def show_warning(self, warning_msg: str) -> None:
         """Display warning message"""
-        print(f"⚠️  Warning: {warning_msg}")
\ No newline at end of file
+        print(f"⚠️  Warning: {warning_msg}")
+
+
+# DisplayFormatter is stateless, so every ConsoleDisplay shares this instance
+default_formatter = DisplayFormatter()
\ No newline at end of file
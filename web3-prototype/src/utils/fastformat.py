@@ -0,0 +1,53 @@
+import numpy as np
+from numba import njit, prange
+from typing import List, Sequence
+from ..config import Web3Config
+
+# Wide enough for the largest int64 unit count: 11 whole digits, 3 separators, the point and 8 decimals
+ROW_WIDTH = 32
+_WEI_PER_UNIT = 10 ** (18 - Web3Config.ETH_DECIMAL_PLACES)
+
+
+@njit(parallel=True, cache=True)
+def _format_units_kernel(units, decimals, out, starts):
+    # Each row is filled right to left, so the text ends at the row end and starts at starts[row]
+    scale = 10 ** decimals
+    for row in prange(units.shape[0]):
+        whole = units[row] // scale
+        frac = units[row] % scale
+        pos = ROW_WIDTH
+        for _ in range(decimals):
+            pos -= 1
+            out[row, pos] = 48 + frac % 10
+            frac //= 10
+        pos -= 1
+        out[row, pos] = 46  # '.'
+        digits = 0
+        while True:
+            if digits > 0 and digits % 3 == 0:
+                pos -= 1
+                out[row, pos] = 44  # ','
+            pos -= 1
+            out[row, pos] = 48 + whole % 10
+            whole //= 10
+            digits += 1
+            if whole == 0:
+                break
+        starts[row] = pos
+
+
+def format_eth_balances_bulk(balances_wei: Sequence[int]) -> List[str]:
+    """Format many Wei balances like DisplayFormatter.format_eth_balance in one native pass.
+
+    Raises OverflowError for balances above ~9.2e10 ETH, which do not fit the kernel's int64 units,
+    and ValueError for negative balances.
+    """
+    count = len(balances_wei)
+    # Truncating to the last displayed decimal keeps realistic balances inside int64
+    units = np.fromiter((balance // _WEI_PER_UNIT for balance in balances_wei), dtype=np.int64, count=count)
+    if count and units.min() < 0:
+        raise ValueError("Balances must not be negative")
+    out = np.empty((count, ROW_WIDTH), dtype=np.uint8)
+    starts = np.empty(count, dtype=np.int64)
+    _format_units_kernel(units, Web3Config.ETH_DECIMAL_PLACES, out, starts)
+    return [f"{out[row, starts[row]:].tobytes().decode('ascii')} ETH" for row in range(count)]
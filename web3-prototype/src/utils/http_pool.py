@@ -0,0 +1,23 @@
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_pooled_http_session: Optional[requests.Session] = None
+
+
+def get_pooled_http_session(pool_connections: int, pool_maxsize: int,
+                            max_retries: int, backoff_factor: float) -> requests.Session:
+    """Return the process-wide keep-alive requests session, creating it on first use"""
+    global _pooled_http_session
+    if _pooled_http_session is None:
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=max_retries, backoff_factor=backoff_factor)
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _pooled_http_session = session
+    return _pooled_http_session
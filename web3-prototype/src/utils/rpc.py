@@ -0,0 +1,48 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import requests
+from web3 import Web3
+from web3._utils.request import make_post_request
+
+RPCCall = Tuple[str, List[Any]]
+
+
+def batch_responses(w3: Web3, calls: Sequence[RPCCall]) -> Optional[List[Optional[Dict[str, Any]]]]:
+    """Send several JSON-RPC calls in one HTTP round-trip and return each raw response in call order.
+
+    Failed calls keep their error response and missing ones are None, so callers can retry them individually.
+    Returns None when the provider has no HTTP endpoint or the batch as a whole failed: connection errors,
+    nodes without batch support and unparseable replies all leave the individual calls to the caller.
+    """
+    endpoint_uri = getattr(w3.provider, 'endpoint_uri', None)
+    if endpoint_uri is None:
+        return None
+
+    payload = [
+        {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+        for request_id, (method, params) in enumerate(calls, 1)
+    ]
+    try:
+        raw_response = make_post_request(
+            endpoint_uri,
+            json.dumps(payload).encode(),
+            **dict(w3.provider.get_request_kwargs())
+        )
+        decoded = json.loads(raw_response)
+    except (requests.RequestException, ValueError):
+        return None
+
+    if not isinstance(decoded, list):
+        # Nodes without batch support answer with a single error object
+        return None
+
+    # JSON-RPC 2.0 does not guarantee response order, so results are matched back by id
+    responses = {response.get('id'): response for response in decoded}
+    return [responses.get(request_id) for request_id in range(1, len(calls) + 1)]
+
+
+def batched_quantity(response: Optional[Dict[str, Any]], fallback: Callable[[], Optional[int]]) -> Optional[int]:
+    """Decode a hex quantity from a batch response, or run the individual call if the batch did not answer it"""
+    if response is not None and 'error' not in response:
+        return int(response['result'], 16)
+    return fallback()
@@ -1,8 +1,20 @@
+import re
 import warnings
+from functools import lru_cache
 from typing import Optional
+from web3 import Web3
 from eth_account.signers.local import LocalAccount
 from ..config import Web3Config
 
+# Single-case hex addresses carry no checksum, so the pattern alone decides them
+_HEX_ADDR_RE = re.compile(r'0x(?:[0-9a-f]{40}|[0-9A-F]{40})')
+
+
+@lru_cache(maxsize=1024)
+def _validate_address_cached(address: str) -> bool:
+    """Checksum validation result per address; the same few accounts are validated on every transaction"""
+    return Web3.is_address(address)
+
 
 class SecurityManager:
     """Handles security-related operations and warnings"""
@@ -41,9 +53,10 @@ class SecurityManager:
     @staticmethod
     def validate_address(address: str) -> bool:
         """Validate Ethereum address format"""
+        if isinstance(address, str) and _HEX_ADDR_RE.fullmatch(address):
+            return True
         try:
-            from web3 import Web3
-            return Web3.is_address(address)
+            return _validate_address_cached(address)
         except Exception:
             return False
     
@@ -59,4 +72,8 @@ class SecurityManager:
         if gas_limit is not None and gas_limit < Web3Config.DEFAULT_GAS_LIMIT:
             return False
         
-        return True
\ No newline at end of file
+        return True
+
+
+# SecurityManager is stateless, so every component shares this instance
+default_security = SecurityManager()
\ No newline at end of file